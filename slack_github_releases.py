@@ -3,14 +3,95 @@
 Slackチャンネルから1週間分のGitHubリリース通知を抽出するスクリプト
 """
 
+import io
+import json
 import os
-import re
-import requests
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from itertools import chain, groupby
+from pathlib import Path
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+# USE_RE2=true の場合は google-re2 の線形時間エンジンを使う（ReDoS対策。通常の入力では re の方が速い）
+# RE2の \b, \s, \d はASCIIのみを対象とするため、re でも re.ASCII を指定して結果を揃える
+# （例: "リリースv1.2.3" からも v1.2.3 を抽出し、全角数字はバージョンとみなさない）
+_use_re2 = os.environ.get("USE_RE2", "").lower() in ("true", "1", "yes")
+if _use_re2:
+    try:
+        import re2
+    except ImportError:
+        print("⚠️ USE_RE2 が指定されていますが google-re2 がインストールされていません（標準の re を使います）")
+        _use_re2 = False
+
+if _use_re2:
+    def _compile(pattern: str):
+        return re2.compile(pattern)
+else:
+    import re
+
+    def _compile(pattern: str):
+        return re.compile(pattern, re.ASCII)
+
+# リリース通知の解析に使う正規表現パターン
+_REPO_PATTERN = r'(?:in|for)\s+(?P<repo>[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+)'
+_VERSION_PATTERN = r'\b(?P<version>v?\d+\.\d+\.\d+(?:[.-][a-zA-Z0-9]+)?)\b'
+# URLパターン: /releases/tag/xxx まで（|などの特殊文字を除外）
+_URL_PATTERN = (
+    r'(?P<url>https://github\.com/(?P<owner>[a-zA-Z0-9_-]+)/(?P<name>[a-zA-Z0-9_.-]+)'
+    r'/releases/tag/(?P<tag>[a-zA-Z0-9_.-]+))'
+)
+_REPO_RE = _compile(_REPO_PATTERN)
+_VERSION_RE = _compile(_VERSION_PATTERN)
+_URL_RE = _compile(_URL_PATTERN)
+# GitHub API URL変換用（owner, repo, tag を抽出）
+_API_URL_RE = _compile(r'github\.com/([^/]+)/([^/]+)/releases/tag/(.+)')
+
+
+def _load_json_cache(path: Path) -> Dict:
+    """JSON形式のキャッシュファイルを読み込む（存在しない・壊れている場合は空）"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_json_cache(path: Path, data: Dict):
+    """JSON形式のキャッシュファイルを書き込む"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"  ⚠️ キャッシュ書き込みエラー ({path}): {e}")
+
+
+def _notes_cache_key(owner: str, repo: str, tag: str) -> str:
+    """リリースノートのキャッシュのキー"""
+    return f"{owner}/{repo}@{tag}"
+
+
+def _search_release_fields(text: str, repo_match, version_match, url_match):
+    """
+    テキストからリポジトリ名、バージョン、URLのうち未取得のものを検索
+
+    Returns:
+        (repo_match, version_match, url_match) のタプル
+    """
+    # 各パターンは最初の一致で止まるため、個別に検索する
+    if not repo_match:
+        repo_match = _REPO_RE.search(text)
+    if not version_match:
+        version_match = _VERSION_RE.search(text)
+    if not url_match:
+        url_match = _URL_RE.search(text)
+
+    return repo_match, version_match, url_match
+
 
 class SlackGitHubReleaseScanner:
     def __init__(self, token: str, channel_name: str = "notification-development"):
@@ -22,6 +103,51 @@ class SlackGitHubReleaseScanner:
         self.client = WebClient(token=token)
         self.channel_name = channel_name
         self.channel_id = None
+        # チャンネルIDのキャッシュ（チーム、チャンネル名ごと）
+        self._id_cache_path = Path(
+            os.environ.get("CHANNEL_ID_CACHE", "~/.cache/slack-gh-releases-channels.json")
+        ).expanduser()
+        self._id_cache_key = None
+        self._channel_id_from_cache = False
+
+        # GitHub API用のHTTPセッション（リリースノート取得時に作成）
+        self._http = None
+        self._http_lock = threading.Lock()
+        self._github_token = os.environ.get("GITHUB_TOKEN")
+
+        # リリースノートのキャッシュ（ETagによる条件付きリクエスト用）
+        self._notes_cache_path = Path(
+            os.environ.get("RELEASE_NOTES_CACHE", "~/.cache/slack-gh-releases.json")
+        ).expanduser()
+        self._notes_cache = None
+        self._notes_cache_lock = threading.Lock()
+        # 今回のスキャンで参照したキャッシュのキー（保存時にそれ以外を削除する）
+        self._notes_cache_used = set()
+
+    def _get_http(self):
+        """GitHub API用のHTTPセッションを取得（初回呼び出し時に作成し、コネクションを再利用する）"""
+        with self._http_lock:
+            if self._http is None:
+                # リリースノートを取得しない場合は requests を読み込まない
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                http = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+                )
+                http.mount("https://", adapter)
+                http.headers.update({
+                    "Accept": "application/vnd.github+json",
+                    "User-Agent": "slack-scan-github-release",
+                })
+                if self._github_token:
+                    http.headers["Authorization"] = f"token {self._github_token}"
+                self._http = http
+            return self._http
 
     def get_channel_id(self) -> str:
         """チャンネル名からチャンネルIDを取得"""
@@ -29,17 +155,48 @@ class SlackGitHubReleaseScanner:
             return self.channel_id
 
         try:
-            # チャンネル一覧を取得
-            result = self.client.conversations_list(types="public_channel,private_channel")
-            for channel in result["channels"]:
-                if channel["name"] == self.channel_name:
-                    self.channel_id = channel["id"]
-                    return self.channel_id
+            # キャッシュ済みのチャンネルIDがあればそれを使う
+            team_id = self.client.auth_test()["team_id"]
+            cache_key = f"{team_id}:{self.channel_name}"
+            self._id_cache_key = cache_key
+            cache = _load_json_cache(self._id_cache_path)
+            if cache.get(cache_key):
+                self.channel_id = cache[cache_key]
+                self._channel_id_from_cache = True
+                return self.channel_id
+
+            # チャンネル一覧を取得（ページネーション対応、アーカイブ済みは除外）
+            cursor = None
+            while True:
+                result = self.client.conversations_list(
+                    types="public_channel,private_channel",
+                    exclude_archived=True,
+                    limit=1000,
+                    cursor=cursor
+                )
+                for channel in result["channels"]:
+                    if channel["name"] == self.channel_name:
+                        self.channel_id = channel["id"]
+                        cache[cache_key] = self.channel_id
+                        _save_json_cache(self._id_cache_path, cache)
+                        return self.channel_id
+
+                cursor = result.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
 
             raise ValueError(f"チャンネル '{self.channel_name}' が見つかりません")
         except SlackApiError as e:
             raise Exception(f"チャンネルID取得エラー: {e.response['error']}")
 
+    def _forget_cached_channel_id(self):
+        """キャッシュしたチャンネルIDを破棄する（次回の get_channel_id で取得し直す）"""
+        cache = _load_json_cache(self._id_cache_path)
+        if cache.pop(self._id_cache_key, None) is not None:
+            _save_json_cache(self._id_cache_path, cache)
+        self.channel_id = None
+        self._channel_id_from_cache = False
+
     def fetch_messages(self, days: int = 7) -> List[Dict]:
         """
         指定した日数分のメッセージを取得
@@ -50,19 +207,43 @@ class SlackGitHubReleaseScanner:
         Returns:
             メッセージのリスト
         """
+        return list(chain.from_iterable(self._iter_message_pages(days)))
+
+    def _iter_message_pages(self, days: int) -> Iterator[List[Dict]]:
+        """
+        指定した日数分のメッセージをページ単位で取得
+
+        Args:
+            days: 過去何日分のメッセージを取得するか
+
+        Yields:
+            1ページ分のメッセージのリスト
+        """
         print(f"チャンネル '{self.channel_name}' から過去{days}日分のメッセージを取得中...")
         channel_id = self.get_channel_id()
         oldest = (datetime.now() - timedelta(days=days)).timestamp()
 
-        messages = []
         try:
             # チャンネルの履歴を取得
-            result = self.client.conversations_history(
-                channel=channel_id,
-                oldest=oldest,
-                limit=1000  # 最大1000件
-            )
-            messages = result["messages"]
+            try:
+                result = self.client.conversations_history(
+                    channel=channel_id,
+                    oldest=oldest,
+                    limit=1000  # 最大1000件
+                )
+            except SlackApiError as e:
+                # キャッシュしたチャンネルIDが無効になっている場合は1度だけ取得し直す
+                if not self._channel_id_from_cache or \
+                        e.response["error"] not in ("channel_not_found", "not_in_channel"):
+                    raise
+                self._forget_cached_channel_id()
+                channel_id = self.get_channel_id()
+                result = self.client.conversations_history(
+                    channel=channel_id,
+                    oldest=oldest,
+                    limit=1000
+                )
+            yield result["messages"]
 
             # ページネーション対応
             while result.get("has_more"):
@@ -72,23 +253,59 @@ class SlackGitHubReleaseScanner:
                     cursor=result["response_metadata"]["next_cursor"],
                     limit=1000
                 )
-                messages.extend(result["messages"])
-
-            return messages
+                yield result["messages"]
         except SlackApiError as e:
             raise Exception(f"メッセージ取得エラー: {e.response['error']}")
 
-    def parse_release_notifications(self, messages: List[Dict]) -> List[Dict]:
+    def _prefetch_message_pages(self, days: int) -> Iterator[List[Dict]]:
+        """
+        別スレッドで次のページを先読みしながら、取得済みのページを順に返す
+
+        Args:
+            days: 過去何日分のメッセージを取得するか
+
+        Yields:
+            1ページ分のメッセージのリスト
+        """
+        pages = queue.Queue(maxsize=2)
+
+        def producer():
+            try:
+                for page in self._iter_message_pages(days):
+                    pages.put(page)
+            except Exception as e:
+                pages.put(e)
+                return
+            pages.put(None)
+
+        threading.Thread(target=producer, daemon=True).start()
+
+        while True:
+            page = pages.get()
+            if page is None:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+
+    def parse_release_notifications(self, messages: Iterable[Dict]) -> List[Dict]:
         """
         メッセージからGitHubリリース通知を抽出
 
+        Args:
+            messages: メッセージ（ページ単位で取得中のものを順に渡すこともできる）
+
         Returns:
             抽出したリリース情報のリスト
             [{
                 'repository': 'owner/repo',
                 'version': 'v1.0.0',
                 'release_date': datetime,
-                'url': 'https://github.com/...'
+                'url': 'https://github.com/...',
+                # 以下は内部用（出力・リリースノート取得で使用）
+                '_date_str': '2025.3.29',
+                '_datetime_str': '2025-03-29 12:34:56',
+                '_owner': 'owner', '_repo': 'repo', '_tag': 'v1.0.0',  # URLがある場合のみ
             }, ...]
         """
         releases = []
@@ -109,21 +326,11 @@ class SlackGitHubReleaseScanner:
             if not has_release:
                 continue
 
-            # タイムスタンプを日時に変換
-            ts = float(message.get("ts", 0))
-            msg_datetime = datetime.fromtimestamp(ts)
-
             # リポジトリ名、バージョン、URLの初期化
             repo_match = None
             version_match = None
             url_match = None
 
-            # パターン定義
-            repo_pattern = r'(?:in|for)\s+([a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+)'
-            version_pattern = r'\b(v?\d+\.\d+\.\d+(?:[.-][a-zA-Z0-9]+)?)\b'
-            # URLパターン: /releases/tag/xxx まで（|などの特殊文字を除外）
-            url_pattern = r'https://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+/releases/tag/[a-zA-Z0-9_.-]+'
-
             # attachmentsから情報を取得
             for attachment in attachments:
                 fallback = attachment.get("fallback", "")
@@ -131,53 +338,71 @@ class SlackGitHubReleaseScanner:
                 text = attachment.get("text", "")
                 title_link = attachment.get("title_link", "")
 
-                # Fallback、Title、Textから情報を抽出
-                search_text = f"{fallback} {title} {text}"
+                # Fallback、Title、Textから情報を抽出（Fallbackのみの場合は連結しない）
+                if title or text:
+                    search_text = ' '.join(part for part in (fallback, title, text) if part)
+                else:
+                    search_text = fallback
 
-                if not repo_match:
-                    repo_match = re.search(repo_pattern, search_text)
-                if not version_match:
-                    version_match = re.search(version_pattern, search_text)
-                if not url_match:
-                    url_match = re.search(url_pattern, search_text)
+                repo_match, version_match, url_match = _search_release_fields(
+                    search_text, repo_match, version_match, url_match
+                )
 
                 # title_linkからURLを取得
                 if not url_match and title_link:
                     if "github.com" in title_link and "/releases/" in title_link:
                         # |などの特殊文字の前で終了
-                        clean_link = title_link.split('|')[0].split('>')[0].strip()
-                        url_match = re.search(url_pattern, clean_link)
+                        end = len(title_link)
+                        pos = title_link.find('|')
+                        if pos >= 0:
+                            end = pos
+                        pos = title_link.find('>', 0, end)
+                        if pos >= 0:
+                            end = pos
+                        clean_link = title_link[:end].strip()
+                        url_match = _URL_RE.search(clean_link)
+
+                # すべて取得済みの場合は残りのAttachmentを走査しない
+                if repo_match and version_match and url_match:
+                    break
 
-            # blocksからも情報を取得
+            # blocksからも情報を取得（すべて取得済みなら走査しない）
             blocks = message.get("blocks", [])
             for block in blocks:
+                if repo_match and version_match and url_match:
+                    break
                 if block.get("type") == "section" and block.get("text"):
                     block_text = block["text"].get("text", "")
-                    if not repo_match:
-                        repo_match = re.search(repo_pattern, block_text)
-                    if not version_match:
-                        version_match = re.search(version_pattern, block_text)
-                    if not url_match:
-                        url_match = re.search(url_pattern, block_text)
+                    repo_match, version_match, url_match = _search_release_fields(
+                        block_text, repo_match, version_match, url_match
+                    )
+
+            # タイムスタンプを日時に変換
+            ts = float(message.get("ts", 0))
+            msg_datetime = datetime.fromtimestamp(ts)
 
             # リポジトリ名の取得
             repository = None
             if repo_match:
-                repository = repo_match.group(1)
+                repository = repo_match.group('repo')
             elif url_match:
                 # URLからリポジトリ名を抽出
-                url = url_match.group(0)
-                url_repo_match = re.search(r'github\.com/([a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+)', url)
-                if url_repo_match:
-                    repository = url_repo_match.group(1)
+                repository = f"{url_match.group('owner')}/{url_match.group('name')}"
 
             # リリース情報を追加
             release_info = {
                 'repository': repository or 'Unknown',
-                'version': version_match.group(1) if version_match else 'Unknown',
+                'version': version_match.group('version') if version_match else 'Unknown',
                 'release_date': msg_datetime,
-                'url': url_match.group(0) if url_match else None,
+                'url': url_match.group('url') if url_match else None,
+                # 出力時に使う日時文字列（出力のたびに変換しないよう作成しておく）
+                '_date_str': msg_datetime.strftime('%Y.%-m.%-d'),  # 2025.3.29形式
+                '_datetime_str': msg_datetime.strftime('%Y-%m-%d %H:%M:%S'),
             }
+            # リリースノート取得用にURLの owner, repo, tag を保持
+            if url_match:
+                release_info['_owner'], release_info['_repo'], release_info['_tag'] = \
+                    url_match.group('owner', 'name', 'tag')
             releases.append(release_info)
 
         # リリース日時でソート（新しい順）
@@ -185,6 +410,25 @@ class SlackGitHubReleaseScanner:
 
         return releases
 
+    def _load_notes_cache(self) -> Dict[str, Dict]:
+        """リリースノートのキャッシュを読み込む（初回呼び出し時のみファイルを読む）"""
+        with self._notes_cache_lock:
+            if self._notes_cache is None:
+                self._notes_cache = _load_json_cache(self._notes_cache_path)
+            return self._notes_cache
+
+    def _prune_notes_cache(self):
+        """今回のスキャンで参照しなかったリリースノートをキャッシュから削除"""
+        with self._notes_cache_lock:
+            if self._notes_cache is not None:
+                for key in self._notes_cache.keys() - self._notes_cache_used:
+                    del self._notes_cache[key]
+
+    def _save_notes_cache(self):
+        """リリースノートのキャッシュをファイルに書き込む"""
+        if self._notes_cache is not None:
+            _save_json_cache(self._notes_cache_path, self._notes_cache)
+
     def fetch_release_notes(self, url: str) -> Optional[str]:
         """
         GitHubのリリースURLからリリースノートを取得
@@ -198,45 +442,142 @@ class SlackGitHubReleaseScanner:
         if not url:
             return None
 
-        try:
-            # GitHub API URLに変換
-            # https://github.com/owner/repo/releases/tag/v1.0.0
-            # → https://api.github.com/repos/owner/repo/releases/tags/v1.0.0
-            match = re.search(r'github\.com/([^/]+)/([^/]+)/releases/tag/(.+)', url)
-            if not match:
-                print(f"  ⚠️ URL形式が不正: {url}")
-                return None
+        # GitHub API URLに変換
+        # https://github.com/owner/repo/releases/tag/v1.0.0
+        # → https://api.github.com/repos/owner/repo/releases/tags/v1.0.0
+        match = _API_URL_RE.search(url)
+        if not match:
+            print(f"  ⚠️ URL形式が不正: {url}")
+            return None
 
-            owner, repo, tag = match.groups()
-            # URLデコードされている場合があるので、タグ部分をクリーンアップ
-            tag = tag.split('?')[0].split('#')[0].strip()
+        owner, repo, tag = match.groups()
+        # URLデコードされている場合があるので、タグ部分をクリーンアップ
+        tag = tag.split('?')[0].split('#')[0].strip()
 
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/tags/{tag}"
+        return self.fetch_release_notes_by_tag(owner, repo, tag)
 
-            # GitHub APIにリクエスト
+    def fetch_release_notes_by_tag(self, owner: str, repo: str, tag: str) -> Optional[str]:
+        """
+        リポジトリとタグを指定してリリースノートを取得
+
+        Args:
+            owner: リポジトリのオーナー
+            repo: リポジトリ名
+            tag: リリースのタグ
+
+        Returns:
+            リリースノート（取得失敗時はNone）
+        """
+        api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/tags/{tag}"
+
+        try:
+            # キャッシュ済みの場合はETagを付けて条件付きリクエスト
+            cache = self._load_notes_cache()
+            cache_key = _notes_cache_key(owner, repo, tag)
+            with self._notes_cache_lock:
+                self._notes_cache_used.add(cache_key)
+            cached = cache.get(cache_key)
             headers = {}
-            github_token = os.environ.get("GITHUB_TOKEN")
-            if github_token:
-                headers["Authorization"] = f"token {github_token}"
+            if cached and cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
 
-            response = requests.get(api_url, headers=headers, timeout=10)
+            # GitHub APIにリクエスト
+            response = self._get_http().get(api_url, headers=headers, timeout=10)
 
-            if response.status_code == 200:
+            if response.status_code == 304 and cached:
+                # 変更なし: キャッシュのリリースノートを返す
+                return cached.get("body") or None
+            elif response.status_code == 200:
                 data = response.json()
-                body = data.get("body", "")
+                body = data.get("body", "") or ""
+                cache[cache_key] = {"etag": response.headers.get("ETag"), "body": body}
                 if body:
                     return body
                 else:
-                    print(f"  ℹ️ リリースノートが空です")
+                    # 並列取得中は進捗表示と順序が前後するため、対象のリリースを併記する
+                    print(f"  ℹ️ リリースノートが空です ({owner}/{repo}@{tag})")
                     return None
             else:
                 print(f"  ⚠️ GitHub API エラー (status={response.status_code}): {api_url}")
                 return None
 
         except Exception as e:
-            print(f"  ⚠️ リリースノート取得エラー ({url}): {e}")
+            print(f"  ⚠️ リリースノート取得エラー ({api_url}): {e}")
             return None
 
+    def fetch_release_notes_batch(
+        self, triples: List[Tuple[str, str, str]]
+    ) -> Dict[Tuple[str, str, str], Optional[str]]:
+        """
+        GitHub GraphQL APIで複数のリリースノートをまとめて取得
+
+        GraphQL APIは認証が必須のため、GITHUB_TOKENが設定されている場合のみ使用できる。
+        取得したリリースノートはキャッシュにも保存する。
+
+        Args:
+            triples: (owner, repo, tag) のリスト
+
+        Returns:
+            (owner, repo, tag) をキーとしたリリースノートの辞書
+            （リクエストやエイリアスの解決に失敗した分は含まれない）
+        """
+        results = {}
+        if not self._github_token:
+            return results
+
+        cache = self._load_notes_cache()
+
+        # 1回のクエリが大きくなりすぎないよう分割して取得
+        for start in range(0, len(triples), 50):
+            chunk = triples[start:start + 50]
+
+            # 各リリースをエイリアス r0, r1, ... として1つのクエリにまとめる
+            params = []
+            fields = []
+            variables = {}
+            for i, (owner, repo, tag) in enumerate(chunk):
+                params.append(f"$o{i}: String!, $n{i}: String!, $t{i}: String!")
+                fields.append(
+                    f"r{i}: repository(owner: $o{i}, name: $n{i}) "
+                    f"{{ release(tagName: $t{i}) {{ description }} }}"
+                )
+                variables.update({f"o{i}": owner, f"n{i}": repo, f"t{i}": tag})
+            query = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+
+            try:
+                response = self._get_http().post(
+                    "https://api.github.com/graphql",
+                    json={"query": query, "variables": variables},
+                    timeout=30
+                )
+                if response.status_code != 200:
+                    print(f"  ⚠️ GitHub GraphQL API エラー (status={response.status_code})")
+                    continue
+
+                payload = response.json()
+                errors = payload.get("errors") or []
+                if errors:
+                    reasons = sorted({e.get("type") or e.get("message", "") for e in errors})
+                    print(f"  ⚠️ GitHub GraphQL API エラー ({len(errors)}件): {', '.join(reasons)}")
+
+                # エラーとなったエイリアス（レート制限、存在しないリポジトリ等）はnullになるため
+                # 結果に含めず、REST APIでの取得に回す
+                data = payload.get("data") or {}
+                for i, triple in enumerate(chunk):
+                    node = data.get(f"r{i}")
+                    if node is None:
+                        continue
+                    release = node.get("release") or {}
+                    results[triple] = release.get("description") or None
+                    # GraphQLにはETagが無いため、次回はREST APIで取得してETagを保存する
+                    cache_key = _notes_cache_key(*triple)
+                    cache[cache_key] = {"etag": None, "body": results[triple] or ""}
+                    self._notes_cache_used.add(cache_key)
+            except Exception as e:
+                print(f"  ⚠️ リリースノート一括取得エラー: {e}")
+
+        return results
+
     def scan_releases(self, days: int = 7, fetch_notes: bool = False) -> List[Dict]:
         """
         指定した期間のリリース情報をスキャン
@@ -248,29 +589,114 @@ class SlackGitHubReleaseScanner:
         Returns:
             リリース情報のリスト
         """
-        messages = self.fetch_messages(days)
-        print(f"{len(messages)}件のメッセージを取得しました")
+        message_count = 0
 
-        print("GitHubリリース通知を解析中...")
-        releases = self.parse_release_notifications(messages)
+        def pages():
+            nonlocal message_count
+            for page in self._prefetch_message_pages(days):
+                message_count += len(page)
+                yield page
+
+        # 次のページの取得と並行して、取得済みのメッセージを順に解析
+        releases = self.parse_release_notifications(chain.from_iterable(pages()))
+        print(f"{message_count}件のメッセージを取得しました")
         print(f"{len(releases)}件のリリース通知を見つけました")
 
         # リリースノートを取得
         if fetch_notes and releases:
             print("\nリリースノートを取得中...")
-            for i, release in enumerate(releases, 1):
+            targets = []
+            for release in releases:
+                release['notes'] = None
                 if release.get('url'):
-                    print(f"  [{i}/{len(releases)}] {release['repository']} {release['version']} - {release['url']}")
-                    notes = self.fetch_release_notes(release['url'])
-                    release['notes'] = notes
-                    if notes:
-                        print(f"  ✓ 取得成功 ({len(notes)} 文字)")
+                    targets.append(release)
+
+            done = 0
+
+            def report(release):
+                nonlocal done
+                done += 1
+                print(f"  [{done}/{len(targets)}] {release['repository']} {release['version']} - {release['url']}")
+                if release['notes']:
+                    print(f"  ✓ 取得成功 ({len(release['notes'])} 文字)")
+
+            # GITHUB_TOKENがある場合はGraphQL APIでまとめて取得
+            # （キャッシュ済みのものはREST APIの条件付きリクエストで再検証する）
+            cache = self._load_notes_cache()
+            triples = list(dict.fromkeys(
+                (release['_owner'], release['_repo'], release['_tag'])
+                for release in targets
+                if release.get('_tag')
+                and _notes_cache_key(release['_owner'], release['_repo'], release['_tag']) not in cache
+            ))
+            batch_notes = self.fetch_release_notes_batch(triples) if triples else {}
+            remaining = []
+            for release in targets:
+                triple = (release.get('_owner'), release.get('_repo'), release.get('_tag'))
+                if triple in batch_notes:
+                    release['notes'] = batch_notes[triple]
+                    report(release)
                 else:
-                    release['notes'] = None
+                    remaining.append(release)
+
+            # 残りはREST APIへのリクエストを並列に実行
+            if remaining:
+                with ThreadPoolExecutor(max_workers=min(16, len(remaining))) as executor:
+                    futures = {}
+                    for release in remaining:
+                        # 解析時に取得済みの owner, repo, tag があればURLを再解析しない
+                        if release.get('_tag'):
+                            future = executor.submit(
+                                self.fetch_release_notes_by_tag,
+                                release['_owner'], release['_repo'], release['_tag']
+                            )
+                        else:
+                            future = executor.submit(self.fetch_release_notes, release['url'])
+                        futures[future] = release
+                    for future in as_completed(futures):
+                        release = futures[future]
+                        release['notes'] = future.result()
+                        report(release)
+
+            # 今回のスキャンで使わなかったリリースノートを破棄し、キャッシュが増え続けないようにする
+            self._prune_notes_cache()
+            self._save_notes_cache()
 
         return releases
 
 
+def _release_date_str(release: Dict) -> str:
+    """リリース日を 2025.3.29 形式で取得（解析時に作成済みの文字列があればそれを使う）"""
+    return release.get('_date_str') or release['release_date'].strftime('%Y.%-m.%-d')
+
+
+def _release_datetime_str(release: Dict) -> str:
+    """リリース日時を 2025-03-29 12:34:56 形式で取得（解析時に作成済みの文字列があればそれを使う）"""
+    return release.get('_datetime_str') or release['release_date'].strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _head_lines(text: str, n: int, maxchars: int) -> Tuple[List[str], bool]:
+    """
+    文字列の先頭n行を取得（全体を分割せず、maxchars文字を超えた時点で打ち切る）
+
+    Returns:
+        (先頭の行のリスト, 後続の行があるか) のタプル
+    """
+    lines = []
+    start = 0
+    while len(lines) < n:
+        idx = text.find('\n', start)
+        if idx < 0:
+            lines.append(text[start:])
+            return lines, False
+        lines.append(text[start:idx])
+        start = idx + 1
+        # 改行で連結した長さが上限を超えたら残りは不要
+        if start - 1 > maxchars:
+            break
+    return lines, True
+
+
 def print_releases(releases: List[Dict]):
     """リリース情報を整形して出力"""
     if not releases:
@@ -284,7 +710,7 @@ def print_releases(releases: List[Dict]):
     for i, release in enumerate(releases, 1):
         print(f"{i}. {release['repository']}")
         print(f"   バージョン: {release['version']}")
-        print(f"   リリース日時: {release['release_date'].strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"   リリース日時: {_release_datetime_str(release)}")
         if release['url']:
             print(f"   URL: {release['url']}")
 
@@ -294,12 +720,11 @@ def print_releases(releases: List[Dict]):
             # リリースノートを整形して表示（最初の5行または200文字まで）
             notes = release['notes'].strip()
             if notes:
-                lines = notes.split('\n')
-                preview_lines = lines[:5]
+                preview_lines, has_more = _head_lines(notes, 5, 200)
                 preview = '\n'.join(preview_lines)
                 if len(preview) > 200:
                     preview = preview[:200] + "..."
-                elif len(lines) > 5:
+                elif has_more:
                     preview += "\n   ..."
 
                 # インデントを追加
@@ -317,38 +742,27 @@ def export_to_markdown(releases: List[Dict], output_file: str):
     リリース情報をMarkdown形式で出力
 
     Args:
-        releases: リリース情報のリスト
+        releases: リリース情報のリスト（リリース日時の新しい順）
         output_file: 出力ファイルパス
     """
-    from collections import defaultdict
+    # Markdown生成（行ごとのリストを作らずバッファに直接書き込む）
+    buf = io.StringIO()
 
-    # 日付ごとにグループ化
-    releases_by_date = defaultdict(list)
-    for release in releases:
-        date_str = release['release_date'].strftime('%Y.%-m.%-d')  # 2025.3.29形式
-        releases_by_date[date_str].append(release)
+    # 日付ごとにグループ化（releasesは新しい順にソート済みのため、そのまま日付順になる）
+    for date_str, date_releases in groupby(releases, key=_release_date_str):
+        buf.write(f"- {date_str}\n")
+        buf.write("  - リポジトリの更新リリース情報\n")
 
-    # Markdown生成
-    lines = []
-
-    # 日付順にソート（新しい順）
-    sorted_dates = sorted(releases_by_date.keys(), reverse=True)
-
-    for date_str in sorted_dates:
-        lines.append(f"- {date_str}")
-        lines.append("  - リポジトリの更新リリース情報")
-
-        for release in releases_by_date[date_str]:
+        for release in date_releases:
             repo = release['repository']
             version = release['version']
             url = release['url']
-            release_date = release['release_date'].strftime('%Y.%-m.%-d')
 
             # リリースタイトル行
             if url:
-                lines.append(f"    - [{repo} {version}]({url}) ({release_date})")
+                buf.write(f"    - [{repo} {version}]({url}) ({date_str})\n")
             else:
-                lines.append(f"    - {repo} {version} ({release_date})")
+                buf.write(f"    - {repo} {version} ({date_str})\n")
 
             # リリースノート
             if release.get('notes'):
@@ -365,15 +779,14 @@ def export_to_markdown(releases: List[Dict], output_file: str):
                                 continue
                             elif note_line.startswith('-') or note_line.startswith('*'):
                                 # 既にリスト形式の場合
-                                lines.append(f"      {note_line}")
+                                buf.write(f"      {note_line}\n")
                             else:
                                 # 通常のテキストはリスト形式に
-                                lines.append(f"      - {note_line}")
+                                buf.write(f"      - {note_line}\n")
 
-    # ファイルに書き込み
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
-        f.write('\n')
+    # ファイルに書き込み（リリースが無い場合も改行のみを出力）
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(buf.getvalue() or '\n')
 
     print(f"\nMarkdownファイルを出力しました: {output_file}")
 
@@ -410,7 +823,7 @@ def export_to_html(releases: List[Dict], output_file: str):
             repo = release['repository']
             version = release['version']
             url = release['url']
-            release_date = release['release_date'].strftime('%Y.%-m.%-d')
+            release_date = _release_date_str(release)
 
             # リリースタイトル行
             if url:
@@ -531,18 +944,18 @@ def main():
                 if fetch_notes:
                     fieldnames.append('notes')
 
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for release in releases:
-                    row = {
-                        'repository': release['repository'],
-                        'version': release['version'],
-                        'release_date': release['release_date'].strftime('%Y-%m-%d %H:%M:%S'),
-                        'url': release['url'] or ''
-                    }
-                    if fetch_notes:
-                        row['notes'] = release.get('notes', '') or ''
-                    writer.writerow(row)
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(
+                    (
+                        release['repository'],
+                        release['version'],
+                        _release_datetime_str(release),
+                        release['url'] or '',
+                        *((release.get('notes') or '',) if fetch_notes else ()),
+                    )
+                    for release in releases
+                )
             print(f"\nCSVファイルを出力しました: {output_file}")
 
         # Markdown出力オプション